@@ -1,7 +1,9 @@
 import textwrap
+import threading
 import traceback
-from copy import deepcopy
-from typing import Optional, Iterable, Dict, Any, Tuple, List
+from functools import lru_cache
+from typing import Optional, Iterable, Dict, Any, Tuple, List, FrozenSet
+from urllib.parse import urlencode
 
 from metadata.generated.schema.api.lineage.addLineage import AddLineageRequest
 from metadata.generated.schema.entity.data.database import Database
@@ -22,28 +24,26 @@ from metadata.utils import fqn
 from metadata.utils.filters import filter_by_database
 from metadata.utils.logger import ingestion_logger
 from sqlalchemy import types
-from sqlalchemy.engine import Engine, Inspector
+from sqlalchemy.engine import Connection, Engine, Inspector
 from sqlalchemy.sql.sqltypes import STRINGTYPE
 
 from sqlalchemy_dremio import flight
 
 logger = ingestion_logger()
 
-DREMIO_GET_DATABASES = textwrap.dedent(
+DREMIO_GET_ALL_SCHEMAS = textwrap.dedent(
     """
 SELECT SCHEMA_NAME
 FROM INFORMATION_SCHEMA.SCHEMATA
-WHERE SCHEMA_NAME NOT LIKE '%.%' 
-  AND NOT STARTS_WITH(SCHEMA_NAME, '@') 
-  AND NOT STARTS_WITH(SCHEMA_NAME, '$')
     """
 )
 
-DREMIO_GET_SCHEMAS = textwrap.dedent(
+DREMIO_GET_COLUMNS = textwrap.dedent(
     """
-SELECT SCHEMA_NAME
-FROM INFORMATION_SCHEMA.SCHEMATA
-WHERE SCHEMA_NAME LIKE '{database_name}.%' 
+SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE
+FROM INFORMATION_SCHEMA.COLUMNS
+WHERE TABLE_SCHEMA = '{schema_name}'
+ORDER BY TABLE_NAME, ORDINAL_POSITION
     """
 )
 
@@ -62,12 +62,39 @@ flight._type_map.update({
 })
 
 
+IGNORED_SCHEMA_PREFIXES = ("@", "$")
+
+HANDLED_CONNECTION_OPTIONS = frozenset(
+    {"username", "password", "hostPort", "UseEncryption", "disableCertificateVerification"}
+)
+
+
 class InvalidDremioConnectorException(Exception):
     """
     Connection argument is missing
     """
 
 
+class _CachedColumnsInspector:
+    """
+    Wraps an inspector and serves get_columns(..) from columns reflected in bulk for the whole schema.
+    Tables missing in the bulk result fall back to the wrapped inspector
+    """
+
+    def __init__(self, inspector: Inspector, columns_by_table: Dict[str, List[Dict[str, Any]]]):
+        self._inspector = inspector
+        self._columns_by_table = columns_by_table
+
+    def get_columns(self, table_name: str, schema: Optional[str] = None, **kw) -> List[Dict[str, Any]]:
+        columns = self._columns_by_table.get(table_name)
+        if columns is None:
+            return self._inspector.get_columns(table_name, schema, **kw)
+        return columns
+
+    def __getattr__(self, item):
+        return getattr(self._inspector, item)
+
+
 class DremioConnector(CommonDbSourceService, MultiDBSource):
     """
     Dremio has following design:
@@ -87,10 +114,16 @@ class DremioConnector(CommonDbSourceService, MultiDBSource):
             config: WorkflowSource,
             metadata: OpenMetadata,
     ):
-        self.test_connection = lambda: None
+        # the parent class tests the connection during init, but the connector is not fully initialized at that point
+        self._skip_test = True
         super().__init__(config, metadata)
         self.database = None
-        self.test_connection = self._test_connection
+        self._db_prefix: Optional[str] = None
+        self._all_schemas_cache: Optional[Dict[str, List[str]]] = None
+        self._engine_cache: Dict[int, Engine] = {id(self.service_connection): self.engine}
+        self._columns_cache: Dict[Tuple[str, str], Dict[str, List[Dict[str, Any]]]] = {}
+        self._columns_cache_lock = threading.Lock()
+        self._skip_test = False
         self.test_connection()
 
     @classmethod
@@ -112,7 +145,23 @@ class DremioConnector(CommonDbSourceService, MultiDBSource):
         return None
 
     def get_database_names_raw(self) -> Iterable[str]:
-        yield from self._execute_database_query(DREMIO_GET_DATABASES)
+        yield from self._get_all_schemas().keys()
+
+    def _get_all_schemas(self) -> Dict[str, List[str]]:
+        # Fetch all spaces and folders with a single query instead of one query per space,
+        # a space maps to the list of its folders (without the leading space).
+        # Home spaces (@) and system schemas ($) are skipped here instead of in the query
+        if self._all_schemas_cache is None:
+            all_schemas: Dict[str, List[str]] = {}
+            for schema_name in self._execute_database_query(DREMIO_GET_ALL_SCHEMAS):
+                if schema_name[:1] in IGNORED_SCHEMA_PREFIXES:
+                    continue
+                database_name, _, cleaned_schema_name = schema_name.partition(".")
+                schemas = all_schemas.setdefault(database_name, [])
+                if cleaned_schema_name:
+                    schemas.append(cleaned_schema_name)
+            self._all_schemas_cache = all_schemas
+        return self._all_schemas_cache
 
     # ------------------------------------------------------------------------------------------------------------------
     # ### ################################
@@ -124,20 +173,16 @@ class DremioConnector(CommonDbSourceService, MultiDBSource):
             self.set_inspector(database_name=configured_database)
             yield configured_database
         else:
+            use_fqn_for_filtering = self.source_config.useFqnForFiltering
             for new_database in self.get_database_names_raw():
-                database_fqn = fqn.build(
-                    self.metadata,
-                    entity_type=Database,
-                    service_name=self.context.get().database_service,
-                    database_name=new_database,
-                )
+                # building the fqn is expensive, so only do it when it is needed for filtering or reporting
+                database_fqn = self._build_database_fqn(new_database) if use_fqn_for_filtering else None
                 if filter_by_database(
                         self.source_config.databaseFilterPattern,
-                        database_fqn
-                        if self.source_config.useFqnForFiltering
-                        else new_database,
+                        database_fqn if use_fqn_for_filtering else new_database,
                 ):
-                    self.status.filter(database_fqn, "Database Filtered Out")
+                    self.status.filter(database_fqn or self._build_database_fqn(new_database),
+                                       "Database Filtered Out")
                     continue
                 try:
                     self.set_inspector(database_name=new_database)
@@ -148,6 +193,14 @@ class DremioConnector(CommonDbSourceService, MultiDBSource):
                         f"Error trying to process database {new_database}: {exc}"
                     )
 
+    def _build_database_fqn(self, database_name: str) -> str:
+        return fqn.build(
+            self.metadata,
+            entity_type=Database,
+            service_name=self.context.get().database_service,
+            database_name=database_name,
+        )
+
     # TODO implement
     @staticmethod
     def get_table_description(
@@ -158,38 +211,41 @@ class DremioConnector(CommonDbSourceService, MultiDBSource):
 
     def get_raw_database_schema_names(self) -> Iterable[str]:
         if self.database is not None:
-            schemas = self._execute_database_query(DREMIO_GET_SCHEMAS.format(database_name=self.database))
+            yield from self._get_all_schemas().get(self.database, [])
         else:
-            schemas = self.inspector.get_schema_names()
-
-        for schema_name in schemas:
-            cleaned_schema_name = self._remove_database_from_schema_name(schema_name)
-
-            yield cleaned_schema_name
-
-    def _remove_database_from_schema_name(self, schema_name: str) -> str:
-        if self.database is not None:
-            if not schema_name.startswith(self.database) or schema_name is None or schema_name == self.database:
-                return schema_name
-
-            schema_name = schema_name[len(self.database) + 1:]
-        return schema_name
+            yield from self.inspector.get_schema_names()
 
     def _add_database_to_schema_name(self, schema_name: str) -> str:
-        if self.database is not None:
-            if schema_name is None or schema_name.strip() == "":
-                schema_name = self.database
-            else:
-                schema_name = self.database + "." + schema_name
-        return schema_name
+        if self._db_prefix is None:
+            return schema_name
+        return self._db_prefix + schema_name if schema_name and schema_name.strip() else self.database
 
     def get_columns_and_constraints(  # pylint: disable=too-many-locals
             self, schema_name: str, table_name: str, db_name: str, inspector: Inspector
     ) -> Tuple[
         Optional[List[Column]], Optional[List[TableConstraint]], Optional[List[Dict]]
     ]:
+        schema_name = self._add_database_to_schema_name(schema_name)
+        columns_by_table = self._get_schema_columns(schema_name)
         return super().get_columns_and_constraints(
-            self._add_database_to_schema_name(schema_name), table_name, db_name, inspector)
+            schema_name, table_name, db_name, _CachedColumnsInspector(inspector, columns_by_table))
+
+    def _get_schema_columns(self, schema_name: str) -> Dict[str, List[Dict[str, Any]]]:
+        # sqlalchemy_dremio reflects the columns with one query per table,
+        # so the columns of all tables in a schema are fetched at once and bucketed by table.
+        # With sourceConfig threads > 1 schemas are processed concurrently, each thread on its own connection
+        cache_key = (self.database, schema_name)
+        if cache_key not in self._columns_cache:
+            try:
+                columns_by_table = _fetch_schema_columns(self.connection, schema_name)
+            except Exception as exc:
+                # cache the failure, so the tables of the schema fall back to the per table reflection
+                logger.debug(traceback.format_exc())
+                logger.warning(f"Error reflecting columns of schema {schema_name}, reflecting per table: {exc}")
+                columns_by_table = {}
+            with self._columns_cache_lock:
+                self._columns_cache[cache_key] = columns_by_table
+        return self._columns_cache[cache_key]
 
     def get_schema_definition(
             self, table_type: TableType, table_name: str, schema_name: str, inspector: Inspector
@@ -210,13 +266,24 @@ class DremioConnector(CommonDbSourceService, MultiDBSource):
     def set_inspector(self, database_name: str) -> None:
         # Mainly a copy of the parent class with the small change
         # of storing the database in the current connector instance,
-        # since "database" parameter does not exist for CustomDatabaseConnection
+        # since "database" parameter does not exist for CustomDatabaseConnection.
+        # The engine does not depend on the database, because dremio resolves spaces by the fully qualified
+        # schema path (see _add_database_to_schema_name), so it is created once and reused for all databases
         logger.info(f"Ingesting from database: {database_name}")
 
-        new_service_connection = deepcopy(self.service_connection)
-        self.engine = get_connection(new_service_connection)
-        self.database = database_name
-
+        engine_key = id(self.service_connection)
+        if engine_key not in self._engine_cache:
+            self._engine_cache[engine_key] = get_connection(self.service_connection)
+        self.engine = self._engine_cache[engine_key]
+        if database_name != self.database:
+            self.database = database_name
+            self._db_prefix = database_name + "."
+        self._columns_cache = {}
+
+        # the engine is shared across databases, so the connections of the previous database
+        # have to be returned to the pool explicitly
+        for connection in self._connection_map.values():
+            connection.close()
         self._connection_map = {}  # Lazy init as well
         self._inspector_map = {}
 
@@ -225,51 +292,76 @@ class DremioConnector(CommonDbSourceService, MultiDBSource):
         pass
 
     # TODO implement
-    def _test_connection(self) -> None:
+    def test_connection(self) -> None:
+        if self._skip_test:
+            return
         # see https://docs.open-metadata.org/v1.4.x/sdk/python/build-connector/source
         #   test_connection is used (by OpenMetadata supported connectors ONLY) to validate permissions and connectivity
         #   before moving forward with the ingestion.
         pass
 
 
+def _escape_literal(value: str) -> str:
+    # The flight dbapi of sqlalchemy_dremio ignores query parameters (cursor.execute(query, params) drops params),
+    # so values can not be bound and have to be escaped before being inlined into a string literal
+    return value.replace("'", "''")
+
+
+def _fetch_schema_columns(connection: Connection, schema_name: str) -> Dict[str, List[Dict[str, Any]]]:
+    columns_by_table: Dict[str, List[Dict[str, Any]]] = {}
+    tables_with_unmapped_types = set()
+    rows = connection.execute(DREMIO_GET_COLUMNS.format(schema_name=_escape_literal(schema_name)))
+    for table_name, column_name, data_type in rows:
+        column_type = flight._type_map.get(data_type)
+        if column_type is None:
+            tables_with_unmapped_types.add(table_name)
+            continue
+        columns_by_table.setdefault(table_name, []).append({
+            "name": column_name,
+            "type": column_type,
+            "default": None,
+            "comment": None,
+            "nullable": True,
+        })
+    # columns are built exactly like sqlalchemy_dremio's get_columns(..) does, so the ingested metadata does not
+    # depend on the path. Tables with types unknown to the dialect are left to it
+    for table_name in tables_with_unmapped_types:
+        columns_by_table.pop(table_name, None)
+    return columns_by_table
+
+
 def get_connection_url(connection: CustomDatabaseConnection) -> str:
-    def _get_option_or_else(option_name: str, *, default: Any = None, expected: bool = False):
-        value = connection.connectionOptions.root.get(option_name)
-        if not value:
-            if expected:
-                raise InvalidDremioConnectorException(f"Missing connection option: {option_name}")
-            else:
-                value = default
-        return value
+    return _build_connection_url(frozenset(connection.connectionOptions.root.items()))
+
+
+@lru_cache(maxsize=8)
+def _build_connection_url(connection_options: FrozenSet[Tuple[str, Any]]) -> str:
+    options = dict(connection_options)
 
     scheme_value = "dremio+flight"
-    username = _get_option_or_else("username", expected=True)
+    username = _get_required_option(options, "username")
     # TODO password is in clear text and can be read by anyone in the ui
-    password = _get_option_or_else("password", expected=True)
-    host_port = _get_option_or_else("hostPort", expected=True)
+    password = _get_required_option(options, "password")
+    host_port = _get_required_option(options, "hostPort")
 
-    use_encryption = _get_option_or_else("UseEncryption", default=False, expected=False)
-    disable_certificate_verification = _get_option_or_else("disableCertificateVerification", default=True,
-                                                           expected=False)
+    use_encryption = options.get("UseEncryption") or False
+    disable_certificate_verification = options.get("disableCertificateVerification") or True
 
-    not_handled_options = (
-            set(connection.connectionOptions.root.keys()) -
-            {"username", "password", "hostPort", "UseEncryption", "disableCertificateVerification"}
-    )
+    not_handled_options = [(k, v or None) for k, v in options.items() if k not in HANDLED_CONNECTION_OPTIONS]
 
-    additional_options = "&".join(
-        [f'UseEncryption={use_encryption}', f'disableCertificateVerification={disable_certificate_verification}'] +
-        [f'{k}={_get_option_or_else(k)}' for k in not_handled_options]
+    additional_options = urlencode(
+        [("UseEncryption", use_encryption), ("disableCertificateVerification", disable_certificate_verification)] +
+        not_handled_options
     )
 
-    url = f"{scheme_value}://"
-    url += f"{username}:{password}"
-    url += f"@"
-    url += f"{host_port}"
-    url += f"/?"
-    url += f"{additional_options}"
+    return "".join((scheme_value, "://", username, ":", password, "@", host_port, "/?", additional_options))
+
 
-    return url
+def _get_required_option(options: Dict[str, Any], option_name: str) -> Any:
+    value = options.get(option_name)
+    if not value:
+        raise InvalidDremioConnectorException(f"Missing connection option: {option_name}")
+    return value
 
 
 @connection_with_options_secrets